@@ -1,36 +1,78 @@
 from __future__ import annotations
 
-from dataclasses import replace
-from typing import Iterable
-from uuid import uuid4
+from collections import defaultdict
+from datetime import datetime
+from secrets import token_hex
+from typing import Iterator
 
 from nba_backend.domain.models import NBA_STATUS_NEW, NbaEventLogRecord, NbaRecord, utc_now
 
+ScopeKey = tuple[str, str | None, str | None, str | None]
+
+
+def _scope_key(nba: NbaRecord) -> ScopeKey:
+    return (nba.nba_definition_id, nba.enterprise_number, nba.account_id, nba.contact_id)
+
 
 class InMemoryNbaRepository:
     def __init__(self) -> None:
         self._nbas: dict[str, NbaRecord] = {}
         self._event_to_nba_id: dict[str, str] = {}
+        # Secondary indexes so per-event deactivation is O(scope) instead of
+        # a scan over every NBA: ids of active NBAs grouped by scope, and the
+        # subset that is still in status "new".
+        self._scope_index: dict[ScopeKey, set[str]] = defaultdict(set)
+        self._active_new: set[str] = set()
+
+    def iter_nbas(
+        self,
+        *,
+        account_id: str | None,
+        enterprise_number: str | None,
+        nba_definition_id: str | None = None,
+        status: str | None,
+    ) -> Iterator[NbaRecord]:
+        # NBAs are only inserted at creation time, so dict insertion order is
+        # created_at ascending; iterating in reverse yields newest-first
+        # without the O(N log N) sort or a fully materialized list.
+        for nba in reversed(self._nbas.values()):
+            if not nba.active:
+                continue
+            if account_id is not None and nba.account_id != account_id:
+                continue
+            if enterprise_number is not None and nba.enterprise_number != enterprise_number:
+                continue
+            if nba_definition_id is not None and nba.nba_definition_id != nba_definition_id:
+                continue
+            if status is not None and nba.status != status:
+                continue
+            yield nba
 
     def list_nbas(
         self,
         *,
         account_id: str | None,
         enterprise_number: str | None,
+        nba_definition_id: str | None = None,
         status: str | None,
         limit: int,
         offset: int,
     ) -> tuple[list[NbaRecord], int]:
-        filtered = [
-            nba
-            for nba in self._nbas.values()
-            if nba.active
-            and _match_identifiers(nba, account_id, enterprise_number)
-            and (status is None or nba.status == status)
-        ]
-        filtered.sort(key=lambda n: n.created_at, reverse=True)
-        total = len(filtered)
-        return filtered[offset : offset + limit], total
+        # The API contract includes the total match count, so the stream is
+        # consumed fully here; only the requested page is kept in memory.
+        window: list[NbaRecord] = []
+        end = offset + limit
+        matched = 0
+        for nba in self.iter_nbas(
+            account_id=account_id,
+            enterprise_number=enterprise_number,
+            nba_definition_id=nba_definition_id,
+            status=status,
+        ):
+            if offset <= matched < end:
+                window.append(nba)
+            matched += 1
+        return window, matched
 
     def get_nba(self, nba_id: str) -> NbaRecord | None:
         return self._nbas.get(nba_id)
@@ -50,22 +92,36 @@ class InMemoryNbaRepository:
             return self._nbas.get(nba_id)
 
         nba = NbaRecord(
-            id=f"nba_{uuid4().hex[:10]}",
+            id=f"nba_{token_hex(5)}",
             nba_definition_id=nba_definition_id,
             enterprise_number=enterprise_number,
             account_id=account_id,
             contact_id=contact_id,
-            context=dict(context),
+            # The caller hands over a freshly validated dict it does not
+            # retain; the record owns it from here, no defensive copy needed.
+            context=context,
         )
         self._nbas[nba.id] = nba
         self._event_to_nba_id[event_id] = nba.id
+        self._scope_index[_scope_key(nba)].add(nba.id)
+        self._active_new.add(nba.id)
         return nba
 
     def update_status(self, nba_id: str, status: str) -> NbaRecord:
+        # NbaRecord is a mutable slots dataclass; flipping fields in place
+        # avoids allocating and re-inserting a new instance per update.
         existing = self._nbas[nba_id]
-        updated = replace(existing, status=status, updated_at=utc_now())
-        self._nbas[nba_id] = updated
-        return updated
+        existing.status = status
+        existing.updated_at = utc_now()
+        if status != NBA_STATUS_NEW:
+            self._active_new.discard(nba_id)
+        return existing
+
+    def _deactivate(self, nba_id: str, existing: NbaRecord, now: datetime) -> None:
+        existing.active = False
+        existing.updated_at = now
+        self._scope_index[_scope_key(existing)].discard(nba_id)
+        self._active_new.discard(nba_id)
 
     def deactivate_other_active_new_for_scope(
         self,
@@ -76,52 +132,47 @@ class InMemoryNbaRepository:
         account_id: str | None,
         contact_id: str | None,
     ) -> int:
-        deactivated = 0
-        for nba_id, existing in list(self._nbas.items()):
-            if nba_id == keep_nba_id:
-                continue
-            if not existing.active or existing.status != NBA_STATUS_NEW:
-                continue
-            if existing.nba_definition_id != nba_definition_id:
-                continue
-            if existing.enterprise_number != enterprise_number:
-                continue
-            if existing.account_id != account_id:
-                continue
-            if existing.contact_id != contact_id:
-                continue
-
-            self._nbas[nba_id] = replace(existing, active=False, updated_at=utc_now())
-            deactivated += 1
-        return deactivated
+        key: ScopeKey = (nba_definition_id, enterprise_number, account_id, contact_id)
+        candidates = (self._scope_index.get(key, set()) & self._active_new) - {keep_nba_id}
+        now = utc_now()
+        for nba_id in candidates:
+            self._deactivate(nba_id, self._nbas[nba_id], now)
+        return len(candidates)
 
     def deactivate_nbas_by_ids(self, *, nba_ids: list[str]) -> int:
         deactivated = 0
-        for nba_id in dict.fromkeys(nba_ids):
+        now = utc_now()
+        seen: set[str] = set()
+        for nba_id in nba_ids:
+            if nba_id in seen:
+                continue
+            seen.add(nba_id)
             existing = self._nbas.get(nba_id)
             if existing is None or not existing.active:
                 continue
-            self._nbas[nba_id] = replace(existing, active=False, updated_at=utc_now())
+            self._deactivate(nba_id, existing, now)
             deactivated += 1
         return deactivated
 
 
 class InMemoryNbaEventLogRepository:
     def __init__(self) -> None:
-        self._events: list[NbaEventLogRecord] = []
+        self._by_nba: dict[str, list[NbaEventLogRecord]] = defaultdict(list)
+        # First action event (acted_by set) per (nba_id, status); later
+        # duplicates never win, matching the previous first-match scan.
+        self._action_event: dict[tuple[str, str], NbaEventLogRecord] = {}
 
     def add(self, event: NbaEventLogRecord) -> NbaEventLogRecord:
-        self._events.append(event)
+        self._by_nba[event.nba_id].append(event)
+        if event.acted_by:
+            self._action_event.setdefault((event.nba_id, event.status), event)
         return event
 
     def list_for_nba(self, nba_id: str) -> list[NbaEventLogRecord]:
-        return [event for event in self._events if event.nba_id == nba_id]
+        return list(self._by_nba.get(nba_id, ()))
 
     def find_action_event(self, nba_id: str, status: str) -> NbaEventLogRecord | None:
-        for event in self._events:
-            if event.nba_id == nba_id and event.status == status and event.acted_by:
-                return event
-        return None
+        return self._action_event.get((nba_id, status))
 
 
 class InMemoryProcessedEventRepository:
@@ -133,15 +184,3 @@ class InMemoryProcessedEventRepository:
 
     def mark_processed(self, event_id: str) -> None:
         self._processed.add(event_id)
-
-
-def _match_identifiers(
-    nba: NbaRecord,
-    account_id: str | None,
-    enterprise_number: str | None,
-) -> bool:
-    checks: Iterable[bool] = (
-        account_id is None or nba.account_id == account_id,
-        enterprise_number is None or nba.enterprise_number == enterprise_number,
-    )
-    return all(checks)
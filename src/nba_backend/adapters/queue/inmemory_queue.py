@@ -1,14 +1,39 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 
 
 class InMemoryCalculationEventQueue:
+    """Unbounded single-consumer queue backed by a deque and a wakeup event.
+
+    asyncio.Queue allocates a Future per get and runs put/get bookkeeping on
+    every operation; with one consumer task a plain deque plus an Event that
+    is only awaited when the queue is empty does the same job cheaper. The
+    consumer blocks in consume() for the first envelope and empties the
+    backlog via drain()/consume_nowait() without touching the event loop.
+    """
+
     def __init__(self) -> None:
-        self._queue: asyncio.Queue[dict] = asyncio.Queue()
+        self._items: deque[dict] = deque()
+        self._not_empty = asyncio.Event()
 
     async def publish(self, payload: dict) -> None:
-        await self._queue.put(payload)
+        self._items.append(payload)
+        self._not_empty.set()
 
     async def consume(self) -> dict:
-        return await self._queue.get()
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self._items.popleft()
+
+    def consume_nowait(self) -> dict:
+        """Pop the next envelope without awaiting; raises IndexError when empty."""
+        return self._items.popleft()
+
+    def drain(self, max_n: int) -> list[dict]:
+        """Pop up to *max_n* already-queued envelopes without awaiting."""
+        items = self._items
+        popleft = items.popleft
+        return [popleft() for _ in range(min(max_n, len(items)))]
@@ -4,10 +4,14 @@ from nba_backend.domain.models import UserContext
 
 DEFAULT_USER = "system"
 
+# The context is constant while header-derived access is disabled; share one
+# immutable instance instead of allocating per request.
+_DEFAULT_CONTEXT = UserContext(
+    username=DEFAULT_USER,
+    allowed_accounts=frozenset(),
+    allowed_clients=frozenset(),
+)
+
 
 def get_user_context() -> UserContext:
-    return UserContext(
-        username=DEFAULT_USER,
-        allowed_accounts=set(),
-        allowed_clients=set(),
-    )
+    return _DEFAULT_CONTEXT
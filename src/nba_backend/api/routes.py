@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import logging
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import JSONResponse
 
 from nba_backend.api.dependencies import get_user_context
 from nba_backend.application.schemas import (
@@ -10,10 +12,9 @@ from nba_backend.application.schemas import (
     ErrorResponse,
     NbaActionRequest,
     NbaActionResponse,
-    NbaItemResponse,
     NbaListResponse,
 )
-from nba_backend.domain.models import NBA_STATUSES, UserContext
+from nba_backend.domain.models import UserContext
 
 router = APIRouter(prefix="/api/v1")
 logger = logging.getLogger(__name__)
@@ -38,21 +39,20 @@ def list_nbas(
     request: Request,
     account_id: str | None = Query(default=None),
     enterprise_number: str | None = Query(default=None),
-    status_filter: str | None = Query(default=None, alias="status"),
+    nba_definition_id: str | None = Query(default=None),
+    status_filter: Literal["new", "accepted", "rejected"] | None = Query(default=None, alias="status"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
     user: UserContext = Depends(get_user_context),
-) -> NbaListResponse:
+) -> JSONResponse:
     services = request.app.state.services
     request_id = getattr(request.state, "request_id", "n/a")
 
-    if status_filter and status_filter not in NBA_STATUSES:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="invalid status filter")
-
     items, total = services.query.list_for_user(
         user,
         account_id=account_id,
         enterprise_number=enterprise_number,
+        nba_definition_id=nba_definition_id,
         status_filter=status_filter,
         limit=limit,
         offset=offset,
@@ -67,24 +67,29 @@ def list_nbas(
         total,
     )
 
-    return NbaListResponse(
-        items=[
-            NbaItemResponse(
-                id=item.id,
-                nba_definition_id=item.nba_definition_id,
-                enterprise_number=item.enterprise_number,
-                account_id=item.account_id,
-                contact_id=item.contact_id,
-                active=item.active,
-                status=item.status,
-                priority=item.priority,
-                context=item.context,
-            )
-            for item in items
-        ],
-        total=total,
-        limit=limit,
-        offset=offset,
+    # Repository records are trusted internal state; returning a Response
+    # directly serializes once and skips per-item model validation while
+    # NbaListResponse still documents the shape in OpenAPI.
+    return JSONResponse(
+        {
+            "items": [
+                {
+                    "id": item.id,
+                    "nba_definition_id": item.nba_definition_id,
+                    "enterprise_number": item.enterprise_number,
+                    "account_id": item.account_id,
+                    "contact_id": item.contact_id,
+                    "active": item.active,
+                    "status": item.status,
+                    "priority": item.priority,
+                    "context": item.context,
+                }
+                for item in items
+            ],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        }
     )
 
 
@@ -138,8 +143,10 @@ def submit_action(
 async def enqueue_calculation_event(payload: CalculationEventRequest, request: Request) -> dict:
     queue = request.app.state.queue
     request_id = getattr(request.state, "request_id", "n/a")
-    normalized = payload.model_dump(mode="json")
-    event_id = normalized["event_id"]
+    # Python-mode dump keeps datetimes native; only event_id needs to be a
+    # string because it keys the processed-event dedup store.
+    normalized = payload.model_dump()
+    normalized["event_id"] = event_id = str(payload.event_id)
     logger.info(
         "api.enqueue_event request_id=%s event_id=%s source=%s",
         request_id,
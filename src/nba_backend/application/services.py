@@ -2,12 +2,11 @@ from __future__ import annotations
 
 from datetime import timezone
 import logging
-from uuid import uuid4
+from secrets import token_hex
 
 from fastapi import HTTPException, status
 
 from nba_backend.domain.models import (
-    ACTION_STATUSES,
     NBA_STATUS_ACCEPTED,
     NBA_STATUS_NEW,
     NBA_STATUS_REJECTED,
@@ -51,6 +50,7 @@ class NbaQueryService:
         *,
         account_id: str | None,
         enterprise_number: str | None,
+        nba_definition_id: str | None = None,
         status_filter: str | None,
         limit: int,
         offset: int,
@@ -64,6 +64,7 @@ class NbaQueryService:
         items, total = self._nba_repo.list_nbas(
             account_id=account_id,
             enterprise_number=enterprise_number,
+            nba_definition_id=nba_definition_id,
             status=status_filter,
             limit=limit,
             offset=offset,
@@ -91,12 +92,8 @@ class NbaActionService:
         comment: str | None,
         user: UserContext,
     ) -> NbaEventLogRecord:
-        if status_value not in ACTION_STATUSES:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="status must be accepted or rejected",
-            )
-
+        # status_value arrives Literal-validated by NbaActionRequest, so no
+        # runtime membership check is needed here.
         nba = self._nba_repo.get_nba(nba_id)
         if nba is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="nba not found")
@@ -123,7 +120,7 @@ class NbaActionService:
 
         self._nba_repo.update_status(nba_id, status_value)
         event = NbaEventLogRecord(
-            id=f"evt_{uuid4().hex[:10]}",
+            id=f"evt_{token_hex(5)}",
             nba_id=nba_id,
             status=status_value,
             context={"comment": comment} if comment else {},
@@ -208,7 +205,7 @@ class CalculationEventService:
                 )
             self._event_log_repo.add(
                 NbaEventLogRecord(
-                    id=f"evt_{uuid4().hex[:10]}",
+                    id=f"evt_{token_hex(5)}",
                     nba_id=nba.id,
                     status=NBA_STATUS_NEW,
                     context={
@@ -221,3 +218,11 @@ class CalculationEventService:
         self._processed_repo.mark_processed(event_id)
         logger.info("calc.event_processed event_id=%s", event_id)
         return {"action": "created", "nba_id": nba.id if nba else "n/a"}
+
+    def process_many(self, payloads: list[dict]) -> list[dict[str, str]]:
+        # The in-memory repositories have no per-call lock to amortize, so
+        # the batch entry point exists for the worker's sake: one call per
+        # drained batch instead of one per event. A locking adapter can
+        # override this to take its lock once for the whole batch.
+        process = self.process
+        return [process(payload) for payload in payloads]
@@ -8,8 +8,8 @@ from typing import Any
 NBA_STATUS_NEW = "new"
 NBA_STATUS_ACCEPTED = "accepted"
 NBA_STATUS_REJECTED = "rejected"
-ACTION_STATUSES = {NBA_STATUS_ACCEPTED, NBA_STATUS_REJECTED}
-NBA_STATUSES = {NBA_STATUS_NEW, NBA_STATUS_ACCEPTED, NBA_STATUS_REJECTED}
+ACTION_STATUSES = frozenset({NBA_STATUS_ACCEPTED, NBA_STATUS_REJECTED})
+NBA_STATUSES = frozenset({NBA_STATUS_NEW, NBA_STATUS_ACCEPTED, NBA_STATUS_REJECTED})
 
 
 def utc_now() -> datetime:
@@ -44,5 +44,5 @@ class NbaEventLogRecord:
 @dataclass(slots=True)
 class UserContext:
     username: str
-    allowed_accounts: set[str] = field(default_factory=set)
-    allowed_clients: set[str] = field(default_factory=set)
+    allowed_accounts: frozenset[str] = field(default=frozenset())
+    allowed_clients: frozenset[str] = field(default=frozenset())
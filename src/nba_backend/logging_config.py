@@ -12,3 +12,10 @@ def configure_logging() -> None:
             logging.StreamHandler(sys.stdout),
         ]
     )
+    # The format above uses none of these fields, yet every LogRecord pays a
+    # current_thread()/getpid()/current_task() lookup to populate them.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    if hasattr(logging, "logAsyncioTasks"):  # Python 3.12+
+        logging.logAsyncioTasks = False
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import os
 import time
 from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass
 from pathlib import Path
-from uuid import uuid4
+from secrets import token_hex
+from types import MappingProxyType
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.responses import HTMLResponse, JSONResponse
 
+try:
+    import uvloop
+except ImportError:  # optional accelerator; the default loop works fine
+    uvloop = None
+
+if uvloop is not None:
+    uvloop.install()
+
 from nba_backend.adapters.inmemory.repositories import (
     InMemoryNbaEventLogRepository,
     InMemoryNbaRepository,
@@ -36,29 +46,59 @@ class Services:
 
 
 logger = logging.getLogger(__name__)
+# Pre-bound for the request middleware: module-global loads beat the
+# attribute walk through the logger on every request.
+_log_info = logger.info
+_log_is_enabled = logger.isEnabledFor
+
+_HEALTH_BODY = b'{"status":"ok"}'
+_ERROR_CODE_MAP = MappingProxyType(
+    {
+        400: "bad_request",
+        401: "unauthorized",
+        403: "forbidden",
+        404: "not_found",
+        409: "conflict",
+    }
+)
+
+
+BATCH_MAX = 64
 
 
 async def queue_worker(app: FastAPI) -> None:
+    # Hoist every per-event attribute walk to a local once: logging levels
+    # are fixed after configure_logging, and the queue/services live for the
+    # whole app, so each iteration is plain LOAD_FAST calls.
     queue = app.state.queue
+    consume = queue.consume
+    drain = queue.drain
     services: Services = app.state.services
+    process_many = services.calc.process_many
+    log_debug = logger.debug
+    log_info = logger.info
+    info_enabled = logger.isEnabledFor(logging.INFO)
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
     while True:
-        envelope = await queue.consume()
-        payload = envelope["payload"]
-        request_id = envelope.get("request_id", "n/a")
-        event_id = payload.get("event_id", "n/a")
-        logger.info(
-            "queue.consume request_id=%s event_id=%s",
-            request_id,
-            event_id,
-        )
-        result = services.calc.process(payload)
-        logger.info(
-            "queue.processed request_id=%s event_id=%s action=%s nba_id=%s",
-            request_id,
-            event_id,
-            result["action"],
-            result["nba_id"],
-        )
+        # The first envelope blocks; the rest of the batch is whatever
+        # already queued up behind it, so per-batch overhead (one service
+        # call, one summary log) amortizes under load while an idle queue
+        # still processes single events immediately.
+        batch = [await consume()]
+        batch.extend(drain(BATCH_MAX - 1))
+        results = process_many([envelope["payload"] for envelope in batch])
+        if info_enabled:
+            log_info("queue.batch_done size=%s", len(batch))
+        if debug_enabled:
+            for envelope, result in zip(batch, results):
+                log_debug(
+                    "queue.done request_id=%s event_id=%s action=%s nba_id=%s",
+                    envelope.get("request_id", "n/a"),
+                    envelope["payload"].get("event_id", "n/a"),
+                    result["action"],
+                    result["nba_id"],
+                )
 
 
 @asynccontextmanager
@@ -66,6 +106,11 @@ async def lifespan(app: FastAPI):
     configure_logging()
     logger.info("app.startup begin")
 
+    if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+
+        # Short-circuits coroutines that finish without suspending, which
+        # benefits the queue worker loop and non-blocking middleware paths.
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     nba_repo = InMemoryNbaRepository()
     event_repo = InMemoryNbaEventLogRepository()
     processed_repo = InMemoryProcessedEventRepository()
@@ -103,37 +148,43 @@ app.include_router(router)
 
 @app.middleware("http")
 async def request_trace_middleware(request: Request, call_next):
-    request_id = request.headers.get("X-Request-Id") or f"req_{uuid4().hex[:10]}"
+    request_id = request.headers.get("X-Request-Id") or f"req_{token_hex(5)}"
     request.state.request_id = request_id
-    started = time.perf_counter()
-    logger.info(
-        "http.request.start request_id=%s method=%s path=%s",
-        request_id,
-        request.method,
-        request.url.path,
-    )
+    # Tracing must cost nothing when INFO is off: skip the perf_counter
+    # calls and URL parsing entirely, not just the emit.
+    trace = _log_is_enabled(logging.INFO)
+    if trace:
+        method = request.method
+        path = request.url.path
+        started = time.perf_counter()
+        _log_info(
+            "http.request.start request_id=%s method=%s path=%s",
+            request_id,
+            method,
+            path,
+        )
     response = await call_next(request)
-    duration_ms = int((time.perf_counter() - started) * 1000)
     response.headers["X-Request-Id"] = request_id
-    logger.info(
-        "http.request.end request_id=%s method=%s path=%s status=%s duration_ms=%s",
-        request_id,
-        request.method,
-        request.url.path,
-        response.status_code,
-        duration_ms,
-    )
+    if trace:
+        duration_ms = int((time.perf_counter() - started) * 1000)
+        _log_info(
+            "http.request.end request_id=%s method=%s path=%s status=%s duration_ms=%s",
+            request_id,
+            method,
+            path,
+            response.status_code,
+            duration_ms,
+        )
     return response
 
 
 @app.get("/health")
-def health() -> dict:
-    return {"status": "ok"}
+def health() -> Response:
+    # Constant body; skip per-request dict construction and JSON encoding.
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
-@app.get("/ui/active-nbas", response_class=HTMLResponse)
-def active_nbas_ui() -> str:
-    return """<!doctype html>
+_ACTIVE_NBAS_HTML = """<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
@@ -419,25 +470,34 @@ def active_nbas_ui() -> str:
 </html>
 """
 
+_UI_BYTES = _ACTIVE_NBAS_HTML.encode("utf-8")
+_UI_ETAG = f'W/"{hashlib.blake2b(_UI_BYTES, digest_size=8).hexdigest()}"'
+
+
+@app.get("/ui/active-nbas", response_class=HTMLResponse)
+def active_nbas_ui(request: Request) -> Response:
+    # The page is constant; encode once at import and let browsers revalidate
+    # with If-None-Match so repeat visits cost a 304 with no body.
+    if request.headers.get("if-none-match") == _UI_ETAG:
+        return Response(status_code=304)
+    return Response(
+        content=_UI_BYTES,
+        media_type="text/html",
+        headers={"ETag": _UI_ETAG, "Cache-Control": "public, max-age=3600"},
+    )
+
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    code_map = {
-        400: "bad_request",
-        401: "unauthorized",
-        403: "forbidden",
-        404: "not_found",
-        409: "conflict",
-    }
-    code = code_map.get(exc.status_code, "error")
-    request_id = getattr(request.state, "request_id", "n/a")
-    logger.warning(
-        "http.error request_id=%s status=%s code=%s detail=%s",
-        request_id,
-        exc.status_code,
-        code,
-        exc.detail,
-    )
+    code = _ERROR_CODE_MAP.get(exc.status_code, "error")
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "http.error request_id=%s status=%s code=%s detail=%s",
+            getattr(request.state, "request_id", "n/a"),
+            exc.status_code,
+            code,
+            exc.detail,
+        )
     return JSONResponse(
         status_code=exc.status_code,
         content={"code": code, "message": str(exc.detail)},
@@ -1,16 +1,26 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Iterator, Protocol
 
 from nba_backend.domain.models import NbaEventLogRecord, NbaRecord
 
 
 class NbaRepository(Protocol):
+    def iter_nbas(
+        self,
+        *,
+        account_id: str | None,
+        enterprise_number: str | None,
+        nba_definition_id: str | None = None,
+        status: str | None,
+    ) -> Iterator[NbaRecord]: ...
+
     def list_nbas(
         self,
         *,
         account_id: str | None,
         enterprise_number: str | None,
+        nba_definition_id: str | None = None,
         status: str | None,
         limit: int,
         offset: int,